@@ -1197,9 +1197,10 @@ class LLM(BaseModel, RetryMixin, NonNativeToolCallingMixin):
     # =========================================================================
     @classmethod
     def load_from_json(cls, json_path: str) -> LLM:
-        with open(json_path) as f:
-            data = json.load(f)
-        return cls(**data)
+        # Let pydantic-core parse the raw bytes, skipping the text decode and
+        # the stdlib json pass.
+        with open(json_path, "rb") as f:
+            return cls.model_validate_json(f.read())
 
     @classmethod
     def load_from_env(cls, prefix: str = "LLM_") -> LLM:
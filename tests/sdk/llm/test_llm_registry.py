@@ -1,71 +1,84 @@
 from __future__ import annotations
 
-import unittest
-from unittest.mock import MagicMock, Mock, patch
+from collections.abc import Callable
+from unittest.mock import Mock, patch, sentinel
 
+import pytest
+
+from openhands.sdk.llm import llm_registry as _llm_registry_mod
 from openhands.sdk.llm.llm import LLM
 from openhands.sdk.llm.llm_registry import LLMRegistry, RegistryEvent
 
 
-class TestLLMRegistry(unittest.TestCase):
-    def setUp(self):
-        """Set up test environment before each test."""
-        # Create a registry for testing
-        self.registry: LLMRegistry = LLMRegistry()
+@pytest.fixture
+def make_llm_mock() -> Callable[[str], Mock]:
+    """Return a factory producing LLM mocks with the given usage_id."""
+
+    def _make(usage_id: str) -> Mock:
+        return Mock(spec=LLM, usage_id=usage_id)
+
+    return _make
+
+
+@pytest.fixture(autouse=True)
+def stub_registry_event(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Stub RegistryEvent so adding mock LLMs skips pydantic validation."""
+    fake = Mock(return_value=Mock())
+    monkeypatch.setattr(_llm_registry_mod, "RegistryEvent", fake)
+    return fake
+
+
+@pytest.fixture
+def registry() -> LLMRegistry:
+    """Create a fresh registry for each test."""
+    return LLMRegistry()
+
+
+def test_subscribe_fires_on_add(registry, make_llm_mock, stub_registry_event):
+    """Test that subscribers are notified when an LLM is added."""
+    events_received = []
 
-    def test_subscribe_and_notify(self):
-        """Test the subscription and notification system."""
-        events_received = []
+    def callback(event: RegistryEvent):
+        events_received.append(event)
 
-        def callback(event: RegistryEvent):
-            events_received.append(event)
+    registry.subscribe(callback)
+    assert registry.subscriber is not None
 
-        # Subscribe to events
-        self.registry.subscribe(callback)
+    registry.add(make_llm_mock("notify-service"))
 
-        # Create a mock LLM and add it to trigger notification
-        mock_llm = Mock(spec=LLM)
-        mock_llm.usage_id = "notify-service"
+    # Should receive notification for the newly added LLM
+    assert events_received == [stub_registry_event.return_value]
 
-        # Mock the RegistryEvent to avoid LLM attribute access
-        with patch(
-            "openhands.sdk.llm.llm_registry.RegistryEvent"
-        ) as mock_registry_event:
-            mock_registry_event.return_value = Mock()
-            self.registry.add(mock_llm)
 
-        # Should receive notification for the newly added LLM
-        self.assertEqual(len(events_received), 1)
+def test_notify_calls_subscriber(registry):
+    """Test that notify forwards the event to the subscriber."""
+    subscriber = Mock()
+    registry.subscriber = subscriber
 
-        # Test that the subscriber is set correctly
-        self.assertIsNotNone(self.registry.subscriber)
+    registry.notify(sentinel.event)
 
-        # Test notify method directly with a mock event
-        with patch.object(self.registry, "subscriber") as mock_subscriber:
-            mock_event = MagicMock()
-            self.registry.notify(mock_event)
-            mock_subscriber.assert_called_once_with(mock_event)
+    subscriber.assert_called_once_with(sentinel.event)
 
-    def test_registry_has_unique_id(self):
-        """Test that each registry instance has a unique ID."""
-        registry2 = LLMRegistry()
-        self.assertNotEqual(self.registry.registry_id, registry2.registry_id)
-        self.assertTrue(len(self.registry.registry_id) > 0)
-        self.assertTrue(len(registry2.registry_id) > 0)
 
+def test_registry_has_unique_id(registry):
+    """Test that each registry instance has a unique ID."""
+    registry2 = LLMRegistry()
+    assert registry.registry_id != registry2.registry_id
+    assert len(registry.registry_id) > 0
+    assert len(registry2.registry_id) > 0
 
-def test_llm_registry_notify_exception_handling():
+
+def test_llm_registry_notify_exception_handling(registry):
     """Test LLM registry handles exceptions in subscriber notification."""
 
     # Create a subscriber that raises an exception
     def failing_subscriber(event):
         raise ValueError("Subscriber failed")
 
-    registry = LLMRegistry()
     registry.subscribe(failing_subscriber)
 
     # Mock the logger to capture warning messages
-    with patch("openhands.sdk.llm.llm_registry.logger") as mock_logger:
+    with patch.object(_llm_registry_mod, "logger") as mock_logger:
         # Create a mock event
         mock_event = Mock()
 
@@ -77,118 +90,34 @@ def test_llm_registry_notify_exception_handling():
         assert "Failed to emit event:" in str(mock_logger.warning.call_args)
 
 
-def test_llm_registry_list_usage_ids():
-    """Test LLM registry list_usage_ids method."""
-
-    registry = LLMRegistry()
-
-    # Create mock LLM objects
-    mock_llm1 = Mock(spec=LLM)
-    mock_llm1.usage_id = "service1"
-    mock_llm2 = Mock(spec=LLM)
-    mock_llm2.usage_id = "service2"
-
-    # Mock the RegistryEvent to avoid LLM attribute access
-    with patch("openhands.sdk.llm.llm_registry.RegistryEvent") as mock_registry_event:
-        mock_registry_event.return_value = Mock()
-
-        # Add some LLMs using the new API
-        registry.add(mock_llm1)
-        registry.add(mock_llm2)
-
-        # Test list_usage_ids
-        usage_ids = registry.list_usage_ids()
-
-        assert "service1" in usage_ids
-        assert "service2" in usage_ids
-        assert len(usage_ids) == 2
-
-
-def test_llm_registry_add_method():
-    """Test the new add() method for LLMRegistry."""
-    registry = LLMRegistry()
+def test_registry_add_get(registry, make_llm_mock, stub_registry_event):
+    """Test the add/get/list_usage_ids workflow of LLMRegistry."""
+    usage_ids = ["service1", "service2"]
+    mock_llms = [make_llm_mock(usage_id) for usage_id in usage_ids]
 
-    # Create a mock LLM
-    mock_llm = Mock(spec=LLM)
-    mock_llm.usage_id = "test-service"
-    service_id = mock_llm.usage_id
-
-    # Mock the RegistryEvent to avoid LLM attribute access
-    with patch("openhands.sdk.llm.llm_registry.RegistryEvent") as mock_registry_event:
-        mock_registry_event.return_value = Mock()
-
-        # Test adding an LLM
+    for mock_llm in mock_llms:
         registry.add(mock_llm)
+        # Verify RegistryEvent was created for the added LLM
+        stub_registry_event.assert_called_with(llm=mock_llm)
 
-        # Verify the LLM was added
-        assert service_id in registry.usage_to_llm
-        assert registry.usage_to_llm[service_id] is mock_llm
-
-        # Verify RegistryEvent was called
-        mock_registry_event.assert_called_once_with(llm=mock_llm)
-
-    # Test that adding the same usage_id raises ValueError
-    with unittest.TestCase().assertRaises(ValueError) as context:
-        registry.add(mock_llm)
+    assert stub_registry_event.call_count == len(mock_llms)
 
-    assert "already exists in registry" in str(context.exception)
+    # Verify the LLMs were added and can be retrieved
+    for mock_llm in mock_llms:
+        assert registry.usage_to_llm[mock_llm.usage_id] is mock_llm
+        assert registry.get(mock_llm.usage_id) is mock_llm
 
+    assert set(registry.list_usage_ids()) == set(usage_ids)
 
-def test_llm_registry_get_method():
-    """Test the new get() method for LLMRegistry."""
-    registry = LLMRegistry()
-
-    # Create a mock LLM
-    mock_llm = Mock(spec=LLM)
-    mock_llm.usage_id = "test-service"
-    service_id = mock_llm.usage_id
-
-    # Mock the RegistryEvent to avoid LLM attribute access
-    with patch("openhands.sdk.llm.llm_registry.RegistryEvent") as mock_registry_event:
-        mock_registry_event.return_value = Mock()
-
-        # Add the LLM first
-        registry.add(mock_llm)
+    # Test that adding another LLM with the same usage_id raises ValueError
+    with pytest.raises(ValueError) as exc_info:
+        registry.add(make_llm_mock("service1"))
 
-        # Test getting the LLM
-        retrieved_llm = registry.get(service_id)
-        assert retrieved_llm is mock_llm
+    assert "already exists in registry" in str(exc_info.value)
+    assert registry.get("service1") is mock_llms[0]
 
     # Test getting non-existent service raises KeyError
-    with unittest.TestCase().assertRaises(KeyError) as context:
+    with pytest.raises(KeyError) as exc_info:
         registry.get("non-existent-service")
 
-    assert "not found in registry" in str(context.exception)
-
-
-def test_llm_registry_add_get_workflow():
-    """Test the complete add/get workflow."""
-    registry = LLMRegistry()
-
-    # Create mock LLMs
-    llm1 = Mock(spec=LLM)
-    llm1.usage_id = "service1"
-    llm2 = Mock(spec=LLM)
-    llm2.usage_id = "service2"
-
-    # Mock the RegistryEvent to avoid LLM attribute access
-    with patch("openhands.sdk.llm.llm_registry.RegistryEvent") as mock_registry_event:
-        mock_registry_event.return_value = Mock()
-
-        # Add multiple LLMs
-        registry.add(llm1)
-        registry.add(llm2)
-
-        # Verify we can retrieve them
-        assert registry.get("service1") is llm1
-        assert registry.get("service2") is llm2
-
-        # Verify list_usage_ids works
-        usage_ids = registry.list_usage_ids()
-        assert "service1" in usage_ids
-        assert "service2" in usage_ids
-        assert len(usage_ids) == 2
-
-        # Verify usage_id is set correctly
-        assert llm1.usage_id == "service1"
-        assert llm2.usage_id == "service2"
+    assert "not found in registry" in str(exc_info.value)